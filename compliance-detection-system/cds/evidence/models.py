@@ -5,7 +5,10 @@ This module defines the Pydantic models for evidence collection and normalizatio
 across static analysis, runtime probes, and final compliance records.
 """
 
-from pydantic import BaseModel, Field
+import sys
+from pydantic.main import BaseModel
+from pydantic.fields import Field
+from pydantic.functional_validators import field_validator
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +24,12 @@ class StaticSignal(BaseModel):
 class GeoSignal(StaticSignal):
     """Geographic branching signal"""
     countries: List[str]
+    
+    @field_validator("countries")
+    @classmethod
+    def intern_countries(cls, countries: List[str]) -> List[str]:
+        """Share one string object per country code across signals"""
+        return [sys.intern(country) for country in countries]
 
 
 class AgeCheckSignal(StaticSignal):
@@ -33,6 +42,12 @@ class DataResidencySignal(StaticSignal):
     """Data residency region signal"""
     region: str
     service: Optional[str] = None
+    
+    @field_validator("region")
+    @classmethod
+    def intern_region(cls, region: str) -> str:
+        """Share one string object per region name across signals"""
+        return sys.intern(region)
 
 
 class FlagSignal(BaseModel):
@@ -7,6 +7,9 @@ and explanation generation.
 
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
@@ -34,6 +37,25 @@ from ..evidence.models import EvidencePack, RulesResult, FinalRecord, PolicySnip
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence (optionally tagged json) wrapping an entire LLM response
+_CODE_FENCE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the body of a fenced response, or the text unchanged"""
+    match = _CODE_FENCE.match(text)
+    return match.group(1) if match else text
+
+
+@lru_cache(maxsize=8)
+def _google_ai_model(model_name: str) -> "genai.GenerativeModel":
+    """Shared Google AI Studio model object per model name
+
+    The cached model keeps the client it was first built with, so a later
+    genai.configure(api_key=...) with a different key does not reach it.
+    """
+    return genai.GenerativeModel(model_name)
+
 
 class PolicySnippetManager:
     """Manages regulatory policy snippets for LLM context"""
@@ -194,8 +216,8 @@ class GeminiClient:
                                policy_snippets: List[PolicySnippet]) -> FinalRecord:
         """Analyze using Google AI Studio API"""
         try:
-            # Initialize the model
-            model = genai.GenerativeModel(self.model_name)
+            # Reuse the model object across analyses
+            model = _google_ai_model(self.model_name)
             
             # Prepare prompt
             prompt = self._build_analysis_prompt(evidence, rules_result, policy_snippets)
@@ -214,10 +236,7 @@ class GeminiClient:
             response_text = response.text.strip()
             
             # Handle markdown code blocks
-            if response_text.startswith('```json') and response_text.endswith('```'):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith('```') and response_text.endswith('```'):
-                response_text = response_text[3:-3].strip()
+            response_text = _strip_code_fence(response_text)
             
             try:
                 result_data = json.loads(response_text)
@@ -255,10 +274,7 @@ class GeminiClient:
             response_text = response.text.strip()
             
             # Handle markdown code blocks
-            if response_text.startswith('```json') and response_text.endswith('```'):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith('```') and response_text.endswith('```'):
-                response_text = response_text[3:-3].strip()
+            response_text = _strip_code_fence(response_text)
             
             try:
                 result_data = json.loads(response_text)
@@ -465,7 +481,7 @@ class LLMAnalysisEngine:
         if not evidence_file.exists():
             raise FileNotFoundError(f"Evidence file not found: {evidence_file}")
         
-        with open(evidence_file, 'r') as f:
+        with open(evidence_file, 'r', encoding='utf-8') as f:
             evidence_data = json.load(f)
         evidence = EvidencePack.model_validate(evidence_data)
         
@@ -476,7 +492,7 @@ class LLMAnalysisEngine:
         if not rules_file.exists():
             raise FileNotFoundError(f"Rules result file not found: {rules_file}")
         
-        with open(rules_file, 'r') as f:
+        with open(rules_file, 'r', encoding='utf-8') as f:
             rules_data = json.load(f)
         rules_result = RulesResult.model_validate(rules_data)
         
@@ -491,6 +507,15 @@ class LLMAnalysisEngine:
         final_record = self.gemini_client.analyze_compliance(evidence, rules_result, policy_snippets)
         
         return final_record
+    
+    def explain_features(self, feature_ids: List[str], max_workers: int = 10) -> List[FinalRecord]:
+        """Generate LLM explanations for several features concurrently
+        
+        Gemini calls are network-bound, so a thread pool overlaps their latency.
+        Results are returned in the same order as ``feature_ids``.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.explain_feature, feature_ids))
 
 
 def explain_feature(feature_id: str, evidence_file: Optional[Path] = None) -> Dict[str, Any]:
@@ -502,7 +527,7 @@ def explain_feature(feature_id: str, evidence_file: Optional[Path] = None) -> Di
     output_file = Path("./artifacts/evidence") / f"{feature_id}_final_record.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        json.dump(final_record.model_dump(), f, indent=2, default=str)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(final_record.model_dump_json(indent=2))
     
     return final_record.model_dump()
@@ -61,6 +61,9 @@ from ..evidence.models import EvidencePack, RulesResult, ComplianceRule
 
 logger = logging.getLogger(__name__)
 
+# Confidence contributed by each matched rule, by severity
+SEVERITY_WEIGHTS = {"low": 0.1, "medium": 0.3, "high": 0.5, "critical": 0.7}
+
 
 class ComplianceRulesEngine:
     """JSON-Logic based compliance rules engine"""
@@ -217,8 +220,7 @@ class ComplianceRulesEngine:
                     missing_controls.update(rule.requires_controls)
                     
                     # Add confidence based on rule severity
-                    severity_weights = {"low": 0.1, "medium": 0.3, "high": 0.5, "critical": 0.7}
-                    total_confidence += severity_weights.get(rule.severity, 0.3)
+                    total_confidence += SEVERITY_WEIGHTS.get(rule.severity, 0.3)
                 
             except Exception as e:
                 logger.warning(f"Failed to evaluate rule {rule_id}: {e}")
@@ -261,25 +263,19 @@ class ComplianceRulesEngine:
         # Flatten complex structures for easier JSON Logic access
         static = data.get("static", {})
         
-        # Convert geo_branching list to countries list
-        if "geo_branching" in static:
-            all_countries = []
-            for geo_signal in static["geo_branching"]:
-                if isinstance(geo_signal, dict) and "countries" in geo_signal:
-                    all_countries.extend(geo_signal["countries"])
-            data["static"]["all_countries"] = list(set(all_countries))
-        else:
-            data["static"]["all_countries"] = []
+        # De-duplicated country and region lists flattened from the signal dicts
+        data["static"]["all_countries"] = list({
+            country
+            for geo_signal in static.get("geo_branching", [])
+            if isinstance(geo_signal, dict)
+            for country in geo_signal.get("countries", ())
+        })
         
-        # Convert data_residency to regions list
-        if "data_residency" in static:
-            all_regions = []
-            for residency_signal in static["data_residency"]:
-                if isinstance(residency_signal, dict) and "region" in residency_signal:
-                    all_regions.append(residency_signal["region"])
-            data["static"]["all_regions"] = list(set(all_regions))
-        else:
-            data["static"]["all_regions"] = []
+        data["static"]["all_regions"] = list({
+            residency_signal["region"]
+            for residency_signal in static.get("data_residency", [])
+            if isinstance(residency_signal, dict) and "region" in residency_signal
+        })
         
         return data
     
@@ -301,7 +297,7 @@ def evaluate_feature(feature_id: str, evidence_file: Optional[Path] = None) -> D
     if not evidence_file.exists():
         raise FileNotFoundError(f"Evidence file not found: {evidence_file}")
     
-    with open(evidence_file, 'r') as f:
+    with open(evidence_file, 'r', encoding='utf-8') as f:
         evidence_data = json.load(f)
     
     evidence = EvidencePack.model_validate(evidence_data)
@@ -312,7 +308,7 @@ def evaluate_feature(feature_id: str, evidence_file: Optional[Path] = None) -> D
     
     # Save results
     results_file = evidence_file.parent / f"{feature_id}_rules_result.json"
-    with open(results_file, 'w') as f:
-        json.dump(result.model_dump(), f, indent=2, default=str)
+    with open(results_file, 'w', encoding='utf-8') as f:
+        f.write(result.model_dump_json(indent=2))
     
     return result.model_dump()
@@ -6,7 +6,6 @@ compliance-related behavior in live applications.
 """
 
 import asyncio
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
@@ -368,7 +367,7 @@ def probe_feature(persona_name: str, url: str, feature_id: Optional[str] = None)
     output_path = Path("./artifacts/evidence") / f"{feature_id}_runtime.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w") as f:
-        json.dump(evidence.model_dump(), f, indent=2, default=str)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(evidence.model_dump_json(indent=2))
     
     return evidence.model_dump()
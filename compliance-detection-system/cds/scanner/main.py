@@ -236,7 +236,7 @@ def scan_repository(repo_path: Path, feature_id: str, output_path: Optional[Path
         output_path = Path("./artifacts/evidence") / f"{feature_id}.json"
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(evidence.model_dump(), f, indent=2, default=str)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(evidence.model_dump_json(indent=2))
     
     return evidence.model_dump()
@@ -6,6 +6,8 @@ This script generates evidence files from the artifacts created by the dataset g
 allowing the compliance detection pipeline to analyze the intentional issues we introduced.
 """
 
+import argparse
+import copy
 import json
 import os
 from pathlib import Path
@@ -13,19 +15,172 @@ import pandas as pd
 from datetime import datetime
 
 
-def create_evidence_from_artifacts(dataset_variation):
-    """Create evidence files from dataset variation artifacts"""
+# Intentional code vulnerabilities planted by the dataset generators.
+# Kept lowercase so content only needs folding once per scan.
+VULN_PATTERNS = {
+    'hardcoded_secrets': ['hardcoded', 'api_key', 'password', 'secret'],
+    'sql_injection_risks': ['sql injection', 'raw sql', 'unsanitized'],
+    'missing_validation': ['missing validation', 'no validation', 'unvalidated'],
+    'insecure_connections': ['http://', 'insecure connection', 'no encryption']
+}
+
+# Zeroed static analysis section, cloned for every feature
+_STATIC_ANALYSIS_TEMPLATE = {
+    "files_analyzed": [],
+    "compliance_signals": {
+        "age_verification_signals": 0,
+        "geographic_branching_signals": 0,
+        "data_residency_signals": 0,
+        "consent_management_signals": 0
+    },
+    "security_issues": {
+        "hardcoded_secrets": 0,
+        "sql_injection_risks": 0,
+        "missing_validation": 0,
+        "insecure_connections": 0
+    }
+}
+
+# Keywords flagging intentional compliance gaps (PRD) and security issues (TRD).
+# Kept lowercase so content only needs folding once per scan.
+COMPLIANCE_KEYWORDS = ['missing', 'inadequate', 'insufficient', 'unclear', 'gap', 'oversight', 'weakness']
+SECURITY_KEYWORDS = ['hardcoded', 'sql injection', 'missing validation', 'insecure', 'weak encryption', 'plaintext']
+
+
+def scan_compliance(content):
+    """Count compliance gap keywords present in a PRD sample"""
+    content_lc = content.lower()
+    return sum(1 for keyword in COMPLIANCE_KEYWORDS if keyword in content_lc)
+
+
+def scan_security(content):
+    """Count security keywords present in a TRD sample"""
+    content_lc = content.lower()
+    return sum(1 for keyword in SECURITY_KEYWORDS if keyword in content_lc)
+
+
+def scan_vuln(content):
+    """Count distinct vulnerability patterns per type in a code sample"""
+    content_lc = content.lower()
+    counts = {}
+    for vuln_type, patterns in VULN_PATTERNS.items():
+        hits = sum(1 for pattern in patterns if pattern in content_lc)
+        if hits:
+            counts[vuln_type] = hits
+    return counts
+
+
+def build_feature_evidence(feature, dataset_variation, run_ts):
+    """Build the evidence record for one feature row of a dataset variation"""
+    variation_path = Path(f"dataset_variations/{dataset_variation}")
+    artifacts_path = variation_path / "artifacts"
+    
+    feature_id = feature['feature_id']
+    
+    # Look for corresponding PRD and TRD files
+    prd_file = artifacts_path / f"{feature_id}_{dataset_variation.split('_')[-2]}_prd.md"
+    trd_file = artifacts_path / f"{feature_id}_{dataset_variation.split('_')[-2]}_trd.md"
+    code_file = None
+    
+    # Look for code files in different directories
+    for code_dir in ["enhanced_code", "security_code", "global_code"]:
+        code_path = variation_path / code_dir
+        if code_path.exists():
+            for code_file_path in code_path.glob(f"{feature_id}_*"):
+                code_file = code_file_path
+                break
+            if code_file:
+                break
+    
+    # Create evidence JSON
+    evidence = {
+        "feature_id": feature_id,
+        "feature_name": feature.get('title', feature_id),
+        "created_at": run_ts,
+        "dataset_variation": dataset_variation,
+        "artifacts": {
+            "prd_available": prd_file.exists() if prd_file else False,
+            "trd_available": trd_file.exists() if trd_file else False, 
+            "code_available": code_file.exists() if code_file else False
+        },
+        "static_analysis": copy.deepcopy(_STATIC_ANALYSIS_TEMPLATE),
+        "rules_engine": {
+            "requires_geo_logic": False,
+            "confidence_score": 0.0,
+            "matched_rules": [],
+            "compliance_domains": feature.get('compliance_domains', '').split(',') if pd.notna(feature.get('compliance_domains')) else []
+        }
+    }
+    
+    # Add file contents if they exist (truncated for analysis)
+    if prd_file and prd_file.exists():
+        try:
+            with open(prd_file, 'r', encoding='utf-8') as f:
+                prd_content = f.read()[:5000]  # First 5000 chars
+                evidence['artifacts']['prd_content_sample'] = prd_content
+                evidence['static_analysis']['files_analyzed'].append(str(prd_file))
+                
+                # Look for intentional compliance issues in PRD
+                potential_issues = scan_compliance(prd_content)
+                if potential_issues:
+                    evidence['static_analysis']['compliance_signals']['potential_issues'] = potential_issues
+        
+        except Exception as e:
+            print(f"⚠️  Error reading PRD {prd_file}: {e}")
+    
+    if trd_file and trd_file.exists():
+        try:
+            with open(trd_file, 'r', encoding='utf-8') as f:
+                trd_content = f.read()[:5000]  # First 5000 chars  
+                evidence['artifacts']['trd_content_sample'] = trd_content
+                evidence['static_analysis']['files_analyzed'].append(str(trd_file))
+                
+                # Look for security issues in TRD
+                potential_vulnerabilities = scan_security(trd_content)
+                if potential_vulnerabilities:
+                    evidence['static_analysis']['security_issues']['potential_vulnerabilities'] = potential_vulnerabilities
+        
+        except Exception as e:
+            print(f"⚠️  Error reading TRD {trd_file}: {e}")
+    
+    if code_file and code_file.exists():
+        try:
+            with open(code_file, 'r', encoding='utf-8') as f:
+                code_content = f.read()[:10000]  # First 10000 chars
+                evidence['artifacts']['code_content_sample'] = code_content
+                evidence['static_analysis']['files_analyzed'].append(str(code_file))
+                
+                # Look for intentional code vulnerabilities - each distinct pattern counts once
+                for vuln_type, hits in scan_vuln(code_content).items():
+                    evidence['static_analysis']['security_issues'][vuln_type] += hits
+        
+        except Exception as e:
+            print(f"⚠️  Error reading code {code_file}: {e}")
+    
+    return evidence
+
+
+def create_evidence_from_artifacts(dataset_variation, ndjson=False):
+    """Create evidence files from dataset variation artifacts
+
+    With ``ndjson`` set, all records for the variation are streamed into a single
+    ``<variation>.ndjson`` file plus a ``feature_id -> byte offset`` index instead of
+    one pretty-printed JSON file per feature. Returns the evidence files created,
+    or the feature ids of the streamed records in NDJSON mode.
+    """
     print(f"🔍 Creating evidence files for {dataset_variation}...")
     
     # Define paths
     variation_path = Path(f"dataset_variations/{dataset_variation}")
     data_path = variation_path / "data"
-    artifacts_path = variation_path / "artifacts"
     evidence_dir = Path("artifacts/evidence")
     
     # Ensure evidence directory exists
     evidence_dir.mkdir(parents=True, exist_ok=True)
     
+    # One timestamp per run - every feature in this pass shares it
+    run_ts = datetime.now().isoformat()
+    
     # Load the feature dataset
     feature_files = {
         "original_comprehensive_focused": "comprehensive_features_dataset.csv",
@@ -46,131 +201,64 @@ def create_evidence_from_artifacts(dataset_variation):
     df = pd.read_csv(feature_file)
     print(f"📋 Loaded {len(df)} features from {dataset_variation}")
     
-    # Create evidence files for each feature
+    # Evidence is built lazily so NDJSON mode streams one record at a time
+    evidence_records = (
+        build_feature_evidence(feature, dataset_variation, run_ts)
+        for _, feature in df.iterrows()
+    )
+    
+    if ndjson:
+        records_written = write_evidence_ndjson(evidence_records, evidence_dir / f"{dataset_variation}.ndjson")
+    else:
+        records_written = write_evidence_files(evidence_records, evidence_dir)
+    
+    kind = "records" if ndjson else "files"
+    print(f"🎯 Created {len(records_written)} evidence {kind} for {dataset_variation}")
+    return records_written
+
+
+def write_evidence_files(evidence_records, evidence_dir):
+    """Write one pretty-printed JSON file per evidence record"""
     evidence_files_created = []
     
-    for _, feature in df.iterrows():
-        feature_id = feature['feature_id']
-        
-        # Look for corresponding PRD and TRD files
-        prd_file = artifacts_path / f"{feature_id}_{dataset_variation.split('_')[-2]}_prd.md"
-        trd_file = artifacts_path / f"{feature_id}_{dataset_variation.split('_')[-2]}_trd.md"
-        code_file = None
-        
-        # Look for code files in different directories
-        for code_dir in ["enhanced_code", "security_code", "global_code"]:
-            code_path = variation_path / code_dir
-            if code_path.exists():
-                for code_file_path in code_path.glob(f"{feature_id}_*"):
-                    code_file = code_file_path
-                    break
-                if code_file:
-                    break
-        
-        # Create evidence JSON
-        evidence = {
-            "feature_id": feature_id,
-            "feature_name": feature.get('title', feature_id),
-            "created_at": datetime.now().isoformat(),
-            "dataset_variation": dataset_variation,
-            "artifacts": {
-                "prd_available": prd_file.exists() if prd_file else False,
-                "trd_available": trd_file.exists() if trd_file else False, 
-                "code_available": code_file.exists() if code_file else False
-            },
-            "static_analysis": {
-                "files_analyzed": [],
-                "compliance_signals": {
-                    "age_verification_signals": 0,
-                    "geographic_branching_signals": 0,
-                    "data_residency_signals": 0,
-                    "consent_management_signals": 0
-                },
-                "security_issues": {
-                    "hardcoded_secrets": 0,
-                    "sql_injection_risks": 0,
-                    "missing_validation": 0,
-                    "insecure_connections": 0
-                }
-            },
-            "rules_engine": {
-                "requires_geo_logic": False,
-                "confidence_score": 0.0,
-                "matched_rules": [],
-                "compliance_domains": feature.get('compliance_domains', '').split(',') if pd.notna(feature.get('compliance_domains')) else []
-            }
-        }
-        
-        # Add file contents if they exist (truncated for analysis)
-        if prd_file and prd_file.exists():
-            try:
-                with open(prd_file, 'r', encoding='utf-8') as f:
-                    prd_content = f.read()[:5000]  # First 5000 chars
-                    evidence['artifacts']['prd_content_sample'] = prd_content
-                    evidence['static_analysis']['files_analyzed'].append(str(prd_file))
-                    
-                    # Look for intentional compliance issues in PRD
-                    compliance_keywords = ['missing', 'inadequate', 'insufficient', 'unclear', 'gap', 'oversight', 'weakness']
-                    for keyword in compliance_keywords:
-                        if keyword.lower() in prd_content.lower():
-                            evidence['static_analysis']['compliance_signals']['potential_issues'] = evidence['static_analysis']['compliance_signals'].get('potential_issues', 0) + 1
-                            
-            except Exception as e:
-                print(f"⚠️  Error reading PRD {prd_file}: {e}")
-        
-        if trd_file and trd_file.exists():
-            try:
-                with open(trd_file, 'r', encoding='utf-8') as f:
-                    trd_content = f.read()[:5000]  # First 5000 chars  
-                    evidence['artifacts']['trd_content_sample'] = trd_content
-                    evidence['static_analysis']['files_analyzed'].append(str(trd_file))
-                    
-                    # Look for security issues in TRD
-                    security_keywords = ['hardcoded', 'sql injection', 'missing validation', 'insecure', 'weak encryption', 'plaintext']
-                    for keyword in security_keywords:
-                        if keyword.lower() in trd_content.lower():
-                            evidence['static_analysis']['security_issues']['potential_vulnerabilities'] = evidence['static_analysis']['security_issues'].get('potential_vulnerabilities', 0) + 1
-                            
-            except Exception as e:
-                print(f"⚠️  Error reading TRD {trd_file}: {e}")
-                
-        if code_file and code_file.exists():
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    code_content = f.read()[:10000]  # First 10000 chars
-                    evidence['artifacts']['code_content_sample'] = code_content
-                    evidence['static_analysis']['files_analyzed'].append(str(code_file))
-                    
-                    # Look for intentional code vulnerabilities
-                    vuln_patterns = {
-                        'hardcoded_secrets': ['hardcoded', 'api_key', 'password', 'secret'],
-                        'sql_injection_risks': ['sql injection', 'raw sql', 'unsanitized'],
-                        'missing_validation': ['missing validation', 'no validation', 'unvalidated'],
-                        'insecure_connections': ['http://', 'insecure connection', 'no encryption']
-                    }
-                    
-                    for vuln_type, patterns in vuln_patterns.items():
-                        for pattern in patterns:
-                            if pattern.lower() in code_content.lower():
-                                evidence['static_analysis']['security_issues'][vuln_type] += 1
-                                
-            except Exception as e:
-                print(f"⚠️  Error reading code {code_file}: {e}")
-        
-        # Save evidence file
-        evidence_file = evidence_dir / f"{feature_id}.json"
+    for evidence in evidence_records:
+        evidence_file = evidence_dir / f"{evidence['feature_id']}.json"
         with open(evidence_file, 'w', encoding='utf-8') as f:
             json.dump(evidence, f, indent=2)
-            
+        
         evidence_files_created.append(evidence_file)
         print(f"✅ Created evidence: {evidence_file}")
     
-    print(f"🎯 Created {len(evidence_files_created)} evidence files for {dataset_variation}")
     return evidence_files_created
 
 
+def write_evidence_ndjson(evidence_records, ndjson_file):
+    """Stream evidence records as compact JSON lines with a byte-offset index"""
+    ndjson_index = {}
+    
+    with open(ndjson_file, 'wb') as f:
+        for evidence in evidence_records:
+            # Remember where each record starts
+            ndjson_index[evidence['feature_id']] = f.tell()
+            f.write(json.dumps(evidence, separators=(',', ':')).encode('utf-8'))
+            f.write(b'\n')
+            print(f"✅ Appended evidence: {evidence['feature_id']} -> {ndjson_file}")
+    
+    index_file = ndjson_file.with_suffix('.index.json')
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump(ndjson_index, f, indent=2)
+    print(f"📇 Wrote offset index: {index_file}")
+    
+    return list(ndjson_index)
+
+
 def main():
     """Generate evidence files for all dataset variations"""
+    parser = argparse.ArgumentParser(description="Generate evidence files for dataset variations")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Write one NDJSON file per variation instead of one JSON file per feature")
+    args = parser.parse_args()
+    
     variations = [
         "original_comprehensive_focused",
         "enterprise_security_focused", 
@@ -184,14 +272,15 @@ def main():
     
     for variation in variations:
         try:
-            evidence_files = create_evidence_from_artifacts(variation)
-            total_evidence_files.extend(evidence_files)
+            evidence_files = create_evidence_from_artifacts(variation, ndjson=args.ndjson)
+            total_evidence_files.extend(evidence_files or [])
             print()
         except Exception as e:
             print(f"❌ Error processing {variation}: {e}")
             print()
     
-    print(f"🎉 Generated {len(total_evidence_files)} total evidence files")
+    kind = "records" if args.ndjson else "files"
+    print(f"🎉 Generated {len(total_evidence_files)} total evidence {kind}")
     print("🚀 Ready to run compliance detection pipeline!")
 
 
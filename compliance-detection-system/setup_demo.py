@@ -6,6 +6,7 @@ This script initializes the CDS environment and runs a basic demo.
 """
 
 import os
+import shutil
 import sys
 from pathlib import Path
 import subprocess
@@ -36,7 +37,7 @@ def setup_environment():
     env_file = Path(".env")
     if not env_file.exists():
         print("📝 Creating .env file from template...")
-        subprocess.run(["copy" if os.name == "nt" else "cp", ".env.example", ".env"], check=True)
+        shutil.copyfile(".env.example", env_file)
         print("✅ Created .env file")
     
     return True
@@ -63,41 +64,39 @@ def run_demo():
     
     try:
         # Test CLI help
-        result = subprocess.run([sys.executable, "-m", "cds.cli.main", "--help"], 
-                              capture_output=True, text=True)
+        result = subprocess.run([sys.executable, "-m", "cds.cli.main", "--help"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if result.returncode == 0:
             print("✅ CLI is working")
         else:
             print("❌ CLI test failed")
             return False
         
-        # Try scanning the sample repo
+        # Try scanning the sample repo - child output streams straight to the console
         print("\n🔍 Running static analysis on sample repo...")
         result = subprocess.run([
             sys.executable, "-m", "cds.cli.main", "scan", 
             "--repo", "./sample_repo", 
             "--feature", "demo_feature"
-        ], capture_output=True, text=True)
+        ])
         
         if result.returncode == 0:
             print("✅ Static scan completed")
             print("📄 Check ./artifacts/evidence/demo_feature.json for results")
         else:
-            print("❌ Static scan failed")
-            print(f"Error: {result.stderr}")
+            print(f"❌ Static scan failed (exit code {result.returncode})")
         
         # Try rules evaluation
         print("\n⚖️ Running rules evaluation...")
         result = subprocess.run([
             sys.executable, "-m", "cds.cli.main", "evaluate",
             "--feature", "demo_feature"
-        ], capture_output=True, text=True)
+        ])
         
         if result.returncode == 0:
             print("✅ Rules evaluation completed")
         else:
-            print("❌ Rules evaluation failed")
-            print(f"Error: {result.stderr}")
+            print(f"❌ Rules evaluation failed (exit code {result.returncode})")
         
         print("\n🎉 Demo completed!")
         print("\nNext steps:")
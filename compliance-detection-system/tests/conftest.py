@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures for CDS tests
+"""
+
+import pytest
+
+# Engine modules are imported inside their fixtures so tests that don't use
+# them never load semgrep/Gemini client dependencies.
+
+
+@pytest.fixture(scope="session")
+def static_engine():
+    """Static analysis engine, built once per test process"""
+    from cds.scanner.main import StaticAnalysisEngine
+    return StaticAnalysisEngine()
+
+
+@pytest.fixture(scope="session")
+def rules_engine():
+    """Compliance rules engine with rules loaded once per test process"""
+    from cds.rules.main import ComplianceRulesEngine
+    return ComplianceRulesEngine()
+
+
+@pytest.fixture(scope="session")
+def llm_engine():
+    """LLM analysis engine with policy snippets loaded once per test process"""
+    from cds.llm.main import LLMAnalysisEngine
+    return LLMAnalysisEngine()
@@ -2,13 +2,23 @@
 Basic tests to validate CDS setup and functionality
 """
 
+import os
 import pytest
-import json
+import orjson
 from pathlib import Path
-from cds.evidence.models import EvidencePack, StaticSignals, GeoSignal
-from cds.scanner.main import StaticAnalysisEngine
-from cds.rules.main import ComplianceRulesEngine
-from cds.llm.main import LLMAnalysisEngine
+from cds.evidence.models import EvidencePack, StaticSignals, GeoSignal, DataResidencySignal, RulesResult
+
+# Project root (compliance-detection-system/)
+BASE = Path(__file__).resolve().parent.parent
+
+
+def _listing(directory):
+    """Names present in a directory - one scandir instead of a stat per file"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
 
 
 def test_evidence_pack_creation():
@@ -30,20 +40,29 @@ def test_evidence_pack_creation():
     assert evidence.static.geo_branching[0].countries == ["US", "CA"]
 
 
-def test_static_analysis_engine():
+def test_signal_location_strings_interned():
+    """Test that repeated country/region strings share one object"""
+    first = GeoSignal(file="a.py", line=1, countries=["".join(["U", "S"])])
+    second = GeoSignal(file="b.py", line=2, countries=["".join(["U", "S"])])
+    assert first.countries[0] is second.countries[0]
+    
+    first = DataResidencySignal(file="a.py", line=1, region="-".join(["eu", "west"]))
+    second = DataResidencySignal(file="b.py", line=2, region="-".join(["eu", "west"]))
+    assert first.region is second.region
+
+
+def test_static_analysis_engine(static_engine):
     """Test static analysis engine initialization"""
-    engine = StaticAnalysisEngine()
-    assert engine.semgrep is not None
-    assert engine.treesitter is not None
+    assert static_engine.semgrep is not None
+    assert static_engine.treesitter is not None
 
 
-def test_rules_engine_initialization():
+def test_rules_engine_initialization(rules_engine):
     """Test compliance rules engine setup"""
-    engine = ComplianceRulesEngine()
-    assert len(engine.rules) > 0
+    assert len(rules_engine.rules) > 0
     
     # Check for key rules
-    rule_ids = set(engine.rules.keys())
+    rule_ids = set(rules_engine.rules.keys())
     expected_rules = {
         "UT_MINORS_CURFEW",
         "NCMEC_REPORTING", 
@@ -54,19 +73,42 @@ def test_rules_engine_initialization():
     assert expected_rules.issubset(rule_ids)
 
 
-def test_llm_analysis_engine():
+def test_llm_analysis_engine(llm_engine):
     """Test LLM analysis engine initialization"""
-    engine = LLMAnalysisEngine()
-    assert engine.gemini_client is not None
-    assert engine.policy_manager is not None
+    assert llm_engine.gemini_client is not None
+    assert llm_engine.policy_manager is not None
     
     # Test policy snippets loading
-    assert len(engine.policy_manager.snippets) > 0
+    assert len(llm_engine.policy_manager.snippets) > 0
+
+
+def test_llm_batch_explain(tmp_path, monkeypatch):
+    """Test batched LLM explanations preserve feature order"""
+    from cds.llm.main import LLMAnalysisEngine
+    
+    # Force the offline mock analysis regardless of local .env credentials
+    for var in ("GOOGLE_API_KEY", "GEMINI_API_KEY", "GOOGLE_CLOUD_PROJECT"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.chdir(tmp_path)
+    
+    evidence_dir = tmp_path / "artifacts" / "evidence"
+    evidence_dir.mkdir(parents=True)
+    feature_ids = [f"batch_feature_{i}" for i in range(5)]
+    for feature_id in feature_ids:
+        evidence = EvidencePack(feature_id=feature_id)
+        (evidence_dir / f"{feature_id}.json").write_text(evidence.model_dump_json())
+        rules_result = RulesResult(feature_id=feature_id, requires_geo_logic=False, confidence=0.0)
+        (evidence_dir / f"{feature_id}_rules_result.json").write_text(rules_result.model_dump_json())
+    
+    engine = LLMAnalysisEngine()
+    records = engine.explain_features(feature_ids, max_workers=3)
+    
+    assert [record.feature_id for record in records] == feature_ids
 
 
 def test_sample_repo_exists():
     """Test that sample repo with compliance patterns exists"""
-    sample_repo = Path(__file__).parent.parent / "sample_repo"
+    sample_repo = BASE / "sample_repo"
     assert sample_repo.exists()
     
     # Check for key files
@@ -76,14 +118,13 @@ def test_sample_repo_exists():
         "privacy_settings.py"
     ]
     
+    present = _listing(sample_repo)
     for filename in expected_files:
-        assert (sample_repo / filename).exists()
+        assert filename in present
 
 
 def test_configuration_files():
     """Test that all required configuration files exist"""
-    base_path = Path(__file__).parent.parent
-    
     required_files = [
         "data/rules/semgrep.yml",
         "data/rules/compliance_rules.json",
@@ -91,19 +132,23 @@ def test_configuration_files():
         "data/sample_dataset.csv"
     ]
     
+    listings = {}
     for filepath in required_files:
-        full_path = base_path / filepath
-        assert full_path.exists(), f"Missing required file: {filepath}"
+        full_path = BASE / filepath
+        if full_path.parent not in listings:
+            listings[full_path.parent] = _listing(full_path.parent)
+        assert full_path.name in listings[full_path.parent], f"Missing required file: {filepath}"
 
 
 def test_semgrep_rules_format():
     """Test that semgrep rules are properly formatted"""
-    rules_file = Path(__file__).parent.parent / "data/rules/semgrep.yml"
+    rules_file = BASE / "data/rules/semgrep.yml"
     
-    # Basic YAML loading test
+    # Basic YAML loading test - libyaml-backed loader when available
     import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(rules_file, 'r') as f:
-        rules_data = yaml.safe_load(f)
+        rules_data = yaml.load(f, Loader=loader)
     
     assert "rules" in rules_data
     assert len(rules_data["rules"]) > 0
@@ -118,10 +163,10 @@ def test_semgrep_rules_format():
 
 def test_json_rules_format():
     """Test that JSON Logic rules are properly formatted"""
-    rules_file = Path(__file__).parent.parent / "data/rules/compliance_rules.json"
+    rules_file = BASE / "data/rules/compliance_rules.json"
     
-    with open(rules_file, 'r') as f:
-        rules_data = json.load(f)
+    with open(rules_file, 'rb') as f:
+        rules_data = orjson.loads(f.read())
     
     assert "rules" in rules_data
     assert len(rules_data["rules"]) > 0
@@ -136,10 +181,10 @@ def test_json_rules_format():
 
 def test_policy_snippets_format():
     """Test that policy snippets are properly formatted"""
-    snippets_file = Path(__file__).parent.parent / "data/policy_snippets.json"
+    snippets_file = BASE / "data/policy_snippets.json"
     
-    with open(snippets_file, 'r') as f:
-        snippets_data = json.load(f)
+    with open(snippets_file, 'rb') as f:
+        snippets_data = orjson.loads(f.read())
     
     assert isinstance(snippets_data, list)
     assert len(snippets_data) > 0